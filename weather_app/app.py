@@ -1,9 +1,50 @@
 from flask import Flask, render_template, request
-import subprocess
-import json
+import os
+import tempfile
+from threading import Event, Lock
+
+import orjson
+import requests
+from cachetools import TTLCache
+from jinja2 import FileSystemBytecodeCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 app = Flask(__name__)
 
+# Persist compiled templates across restarts and compile index.html up
+# front so the first request doesn't pay for it
+_JINJA_CACHE_DIR = os.path.join(tempfile.gettempdir(), "jinja_cache")
+os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_JINJA_CACHE_DIR)
+with app.app_context():
+    app.jinja_env.get_template("index.html")
+
+# Shared session so TCP/TLS connections to Open-Meteo are reused across requests
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.3)),
+)
+# Ask for compressed bodies (requests decodes transparently)
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Open-Meteo's current weather only updates every few minutes, so repeated
+# lookups of the same city can be served from memory instead of the network
+_CACHE = TTLCache(maxsize=64, ttl=120)
+_CACHE_LOCK = Lock()
+
+# ETags and last formatted result per coordinate, so a revalidation that
+# comes back 304 skips the body transfer and reuses the old result
+_ETAGS = {}
+_LAST_RESULT = {}
+
+# Single-flight guard: one Event per coordinate with a fetch in progress,
+# so concurrent cache misses for the same city share one upstream call
+_INFLIGHT = {}
+
 # Dictionary of major Pakistani cities with their coordinates
 PAKISTAN_CITIES = {
     "lahore": {"lat": 31.5204, "lon": 74.3587},
@@ -18,45 +59,125 @@ PAKISTAN_CITIES = {
     "sialkot": {"lat": 32.4915, "lon": 74.5202},
 }
 
+# Weather code mapping (WMO codes)
+WEATHER_DESCRIPTIONS = {
+    0: "Clear sky",
+    1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Foggy", 48: "Depositing rime fog",
+    51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
+    80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
+    85: "Slight snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
+AVAILABLE_CITIES_MSG = "City not found. Available cities: " + ", ".join(
+    c.capitalize() for c in PAKISTAN_CITIES
+)
+
+
+def _fetch_weather(key, lat, lon):
+    """Fetch, format and cache the weather for one coordinate.
+
+    Returns the cached result dict (city left blank) or None on failure.
+    """
+    with _CACHE_LOCK:
+        etag = _ETAGS.get(key)
+    headers = {"If-None-Match": etag} if etag else None
 
-def get_weather_via_curl(lat, lon, city_name):
-    """Fetch weather using curl command to call Open-Meteo API"""
     try:
-        cmd = f'curl -s "https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,weather_code,humidity,wind_speed_10m"'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            current = data.get("current", {})
-            
-            # Weather code mapping (WMO codes)
-            weather_descriptions = {
-                0: "Clear sky",
-                1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-                45: "Foggy", 48: "Depositing rime fog",
-                51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-                61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-                71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
-                80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
-                85: "Slight snow showers", 86: "Heavy snow showers",
-                95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-            }
-            
-            weather_code = current.get("weather_code", 0)
-            description = weather_descriptions.get(weather_code, "Unknown")
-            
-            return {
-                "city": f"{city_name}, Pakistan",
-                "temp": round(current.get("temperature_2m", 0), 1),
-                "description": description,
-                "humidity": current.get("humidity", 0),
-                "wind": round(current.get("wind_speed_10m", 0), 1),
-                "icon": None
-            }
+        response = SESSION.get(
+            OPEN_METEO_URL,
+            params={
+                "latitude": lat,
+                "longitude": lon,
+                "current": "temperature_2m,weather_code,humidity,wind_speed_10m",
+            },
+            headers=headers,
+            timeout=(3, 7),
+        )
+
+        if response.status_code == 304:
+            # Unchanged upstream: reuse the last formatted result
+            with _CACHE_LOCK:
+                cached = _LAST_RESULT.get(key)
+                if cached is not None:
+                    _CACHE[key] = cached
+            return cached
+
+        if response.status_code != 200:
+            return None
+        try:
+            # orjson parses the raw bytes ~2-3x faster than response.json()
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+    except requests.RequestException as e:
+        raise Exception(f"Weather API error: {str(e)}")
+
+    current = data.get("current", {})
+
+    weather_code = current.get("weather_code", 0)
+    description = WEATHER_DESCRIPTIONS.get(weather_code, "Unknown")
+
+    # Cache the fully-formatted result (city filled in per caller) so
+    # hits skip the rounding and description lookups too
+    cached = {
+        "city": None,
+        "temp": round(current.get("temperature_2m", 0), 1),
+        "description": description,
+        "humidity": current.get("humidity", 0),
+        "wind": round(current.get("wind_speed_10m", 0), 1),
+        "icon": None
+    }
+    with _CACHE_LOCK:
+        _CACHE[key] = cached
+        _LAST_RESULT[key] = cached
+        etag = response.headers.get("ETag")
+        if etag:
+            _ETAGS[key] = etag
+    return cached
+
+
+def get_weather(lat, lon, city_name):
+    """Fetch weather from the Open-Meteo API over a pooled session.
+
+    Responses are cached for a couple of minutes per (lat, lon) so repeated
+    views of the same city skip the network entirely, and concurrent misses
+    for the same coordinate coalesce into a single upstream call.
+    """
+    key = (lat, lon)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is None:
+            fetch_done = _INFLIGHT.get(key)
+            is_leader = fetch_done is None
+            if is_leader:
+                fetch_done = Event()
+                _INFLIGHT[key] = fetch_done
+
+    if cached is None:
+        if is_leader:
+            try:
+                cached = _fetch_weather(key, lat, lon)
+            finally:
+                # Publish the result (already in the cache) before waking waiters
+                with _CACHE_LOCK:
+                    _INFLIGHT.pop(key, None)
+                fetch_done.set()
         else:
+            # Another request is fetching this coordinate; wait for it and
+            # read its result out of the cache
+            fetch_done.wait(timeout=8)
+            with _CACHE_LOCK:
+                cached = _CACHE.get(key)
+        if cached is None:
             return None
-    except Exception as e:
-        raise Exception(f"Curl error: {str(e)}")
+
+    weather = cached.copy()
+    weather["city"] = f"{city_name}, Pakistan"
+    return weather
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -70,12 +191,11 @@ def index():
         else:
             city_lower = city.lower()
             if city_lower not in PAKISTAN_CITIES:
-                available = ", ".join([c.capitalize() for c in PAKISTAN_CITIES.keys()])
-                error = f"City not found. Available cities: {available}"
+                error = AVAILABLE_CITIES_MSG
             else:
                 try:
                     coords = PAKISTAN_CITIES[city_lower]
-                    weather = get_weather_via_curl(coords["lat"], coords["lon"], city.capitalize())
+                    weather = get_weather(coords["lat"], coords["lon"], city.capitalize())
                     if weather is None:
                         error = "Failed to fetch weather data. Please try again."
                 except Exception as exc:
@@ -85,4 +205,6 @@ def index():
 
 
 if __name__ == "__main__":
+    # Development server only; in production run e.g.
+    #   gunicorn -k gthread -w 2 --threads 8 -b 0.0.0.0:5000 app:app
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,269 @@
+from flask import Flask, render_template, request, session
+import os
+import threading
+import uuid
+
+import orjson
+from cachetools import LRUCache
+
+app = Flask(__name__, template_folder='templates', static_folder='static')
+app.secret_key = os.environ.get('SECRET_KEY', uuid.uuid4().hex)
+
+
+def ojsonify(obj):
+    # orjson serializes 2-3x faster than the stdlib encoder jsonify uses
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+_EMPTY = '.'
+
+
+def _build_best_moves():
+    """Solve every reachable position once at import time.
+
+    Boards are encoded as 9-char strings ('.' for empty) while solving.
+    Returns a dict keyed by (x_mask, o_mask) mapping each position where O
+    is to move to O's optimal move, so the per-request AI is a single dict
+    lookup straight off the live bitmasks.
+    """
+    winning_combinations = [
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),
+        (0, 4, 8), (2, 4, 6)
+    ]
+    # Try center, then corners, then edges: strong moves surface early so
+    # the immediate-win cutoff below fires more often
+    move_order = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+    memo = {}
+
+    def winner(board):
+        for a, b, c in winning_combinations:
+            if board[a] == board[b] == board[c] != _EMPTY:
+                return board[a]
+        return None
+
+    def solve(board, player):
+        # Returns (score from O's perspective, best move for `player`).
+        # Scores shrink by one per ply so faster wins are preferred.
+        key = (board, player)
+        if key in memo:
+            return memo[key]
+
+        won = winner(board)
+        if won == 'O':
+            result = (10, None)
+        elif won == 'X':
+            result = (-10, None)
+        elif _EMPTY not in board:
+            result = (0, None)
+        else:
+            best_score = float('-inf') if player == 'O' else float('inf')
+            best_move = None
+            opponent = 'X' if player == 'O' else 'O'
+            for move in move_order:
+                if board[move] != _EMPTY:
+                    continue
+                score, _ = solve(board[:move] + player + board[move + 1:], opponent)
+                score = score - 1 if score > 0 else score + 1 if score < 0 else 0
+                if (player == 'O' and score > best_score) or (player == 'X' and score < best_score):
+                    best_score = score
+                    best_move = move
+                    # An immediate O win (score 9) can't be improved on, so
+                    # stop searching this node. X nodes are never cut short:
+                    # a human may play any move, and every O reply that could
+                    # follow has to end up in the table.
+                    if player == 'O' and score == 9:
+                        break
+            result = (best_score, best_move)
+
+        memo[key] = result
+        return result
+
+    # X may move first (the human) or O may (empty-board lookups), so solve
+    # from both roots to cover every reachable position.
+    solve(_EMPTY * 9, 'X')
+    solve(_EMPTY * 9, 'O')
+
+    def masks(board):
+        x_mask = o_mask = 0
+        for i, cell in enumerate(board):
+            if cell == 'X':
+                x_mask |= 1 << i
+            elif cell == 'O':
+                o_mask |= 1 << i
+        return x_mask, o_mask
+
+    return {
+        masks(board): move
+        for (board, player), (_, move) in memo.items()
+        if player == 'O' and move is not None
+    }
+
+
+BEST_MOVE = _build_best_moves()
+
+# Each winning line as a 9-bit mask (bit i = board cell i)
+WIN_LINES = [
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+]
+FULL_BOARD = 0b111111111
+
+
+class TicTacToe:
+    def __init__(self):
+        self.x_mask = 0
+        self.o_mask = 0
+        self.current_player = 'X'
+
+    @property
+    def board(self):
+        # Materialize the list-of-strings view only when serializing to JSON
+        occupied_x = self.x_mask
+        occupied_o = self.o_mask
+        return [
+            'X' if occupied_x >> i & 1 else 'O' if occupied_o >> i & 1 else ''
+            for i in range(9)
+        ]
+
+    def make_move(self, position, player):
+        if 0 <= position < 9:
+            bit = 1 << position
+            if not (self.x_mask | self.o_mask) & bit:
+                if player == 'X':
+                    self.x_mask |= bit
+                else:
+                    self.o_mask |= bit
+                return True
+        return False
+
+    def get_available_moves(self):
+        moves = []
+        empty = ~(self.x_mask | self.o_mask) & FULL_BOARD
+        while empty:
+            bit = empty & -empty
+            moves.append(bit.bit_length() - 1)
+            empty ^= bit
+        return moves
+
+    def check_winner(self):
+        for line in WIN_LINES:
+            if self.x_mask & line == line:
+                return 'X'
+            if self.o_mask & line == line:
+                return 'O'
+        return None
+
+    def is_board_full(self):
+        return (self.x_mask | self.o_mask) == FULL_BOARD
+
+    def get_best_move(self):
+        # AI logic - optimal move looked up from the precomputed minimax table
+        return BEST_MOVE.get((self.x_mask, self.o_mask))
+
+    def reset(self):
+        self.x_mask = 0
+        self.o_mask = 0
+        self.current_player = 'X'
+
+# Pre-serialized payloads for the deterministic empty-board responses
+RESET_RESPONSE = orjson.dumps(
+    {'success': True, 'board': [''] * 9, 'status': 'Game reset', 'game_over': False}
+)
+EMPTY_BOARD_RESPONSE = orjson.dumps(
+    {'board': [''] * 9, 'status': 'Ready', 'game_over': False}
+)
+
+# One game per browser session, bounded so idle games get evicted
+GAMES = LRUCache(maxsize=10_000)
+GAMES_LOCK = threading.Lock()
+
+
+def get_game():
+    sid = session.get('sid')
+    if sid is None:
+        sid = uuid.uuid4().hex
+        session['sid'] = sid
+    with GAMES_LOCK:
+        return GAMES.setdefault(sid, TicTacToe())
+
+
+@app.route('/')
+def index():
+    return render_template('tic_tac_toe.html')
+
+@app.route('/api/make_move', methods=['POST'])
+def make_move():
+    data = request.json
+    position = data.get('position')
+    game = get_game()
+
+    if not game.make_move(position, 'X'):
+        return ojsonify({'success': False, 'message': 'Invalid move'})
+    
+    winner = game.check_winner()
+    if winner:
+        return ojsonify({
+            'success': True,
+            'board': game.board,
+            'status': f'Player X wins!',
+            'game_over': True
+        })
+    
+    if game.is_board_full():
+        return ojsonify({
+            'success': True,
+            'board': game.board,
+            'status': 'It\'s a draw!',
+            'game_over': True
+        })
+    
+    # AI move
+    ai_move = game.get_best_move()
+    if ai_move is not None:
+        game.make_move(ai_move, 'O')
+    
+    winner = game.check_winner()
+    if winner:
+        return ojsonify({
+            'success': True,
+            'board': game.board,
+            'status': f'AI (O) wins!',
+            'game_over': True
+        })
+    
+    if game.is_board_full():
+        return ojsonify({
+            'success': True,
+            'board': game.board,
+            'status': 'It\'s a draw!',
+            'game_over': True
+        })
+    
+    return ojsonify({
+        'success': True,
+        'board': game.board,
+        'status': 'Your turn',
+        'game_over': False
+    })
+
+@app.route('/api/reset', methods=['POST'])
+def reset():
+    game = get_game()
+    game.reset()
+    return app.response_class(RESET_RESPONSE, mimetype='application/json')
+
+@app.route('/api/board', methods=['GET'])
+def get_board():
+    game = get_game()
+    if not (game.x_mask | game.o_mask):
+        return app.response_class(EMPTY_BOARD_RESPONSE, mimetype='application/json')
+    return ojsonify({
+        'board': game.board,
+        'status': 'Ready',
+        'game_over': False
+    })
+
+if __name__ == '__main__':
+    # Development server only; the Docker image runs gunicorn instead
+    app.run(debug=True, port=5000)